@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -8,6 +9,9 @@ RULES_DOC = ROOT / "PROJECT_RULES.md"
 RULES_CFG = ROOT / "rules" / "rules.yml"
 MAPPING = ROOT / "config" / "data_mapping.json"
 
+# 单位建议检查：压力单位为 kPa（单/双引号均可）
+PRESSURE_KPA_RE = re.compile(rb"""pressure:[ \t]*(?:"kPa"|'kPa')""")
+
 FAIL = 1
 OK = 0
 
@@ -71,10 +75,7 @@ def main() -> int:
     ok("data_mapping.json 结构与路径前缀检查通过")
 
     # 补充建议：若存在压力/流量单位，提醒核对与 rules.yml 一致
-    units_cfg = (ROOT / "rules" / "rules.yml").read_text(
-        encoding="utf-8", errors="ignore"
-    )
-    if 'pressure: "kPa"' not in units_cfg and "pressure: 'kPa'" not in units_cfg:
+    if not PRESSURE_KPA_RE.search(RULES_CFG.read_bytes()):
         print(
             "[QUALITY_GATE][WARN] 建议将压力单位设为 kPa（或在 PROJECT_RULES.md 中注明差异与换算）"
         )
@@ -1,4 +1,3 @@
-import re
 import sys
 from pathlib import Path
 
@@ -6,13 +5,12 @@ ROOT = Path(__file__).resolve().parents[1]
 PLAYBOOKS = ROOT / "docs" / "PLAYBOOKS"
 INDEX = PLAYBOOKS / "INDEX.md"
 
-FRONT_RE = re.compile(
-    r"^---\s*$|^id:\s*(.*)$|^date:\s*(.*)$|^module:\s*(.*)$|^severity:\s*(.*)$|^impact:\s*(.*)$|^tags:\s*\[(.*)\]\s*$",
-    re.IGNORECASE,
-)
+# 索引关心的 Front Matter 字段（键名大小写不敏感）
+FRONT_KEYS = frozenset({"id", "date", "module", "severity", "impact", "tags"})
 
 
 def parse_entries(md_path: Path):
+    # 单遍状态机：'---' 切换进出 Front Matter，块内按首个 ':' 拆分键值
     text = md_path.read_text(encoding="utf-8", errors="ignore").splitlines()
     front = {}
     inside = False
@@ -20,12 +18,17 @@ def parse_entries(md_path: Path):
         if line.strip() == "---":
             inside = not inside
             continue
-        if inside:
-            m = FRONT_RE.match(line)
-            if m:
-                k = line.split(":", 1)[0].strip().lower()
-                v = line.split(":", 1)[1].strip()
-                front[k] = v
+        if not inside:
+            continue
+        key, sep, value = line.partition(":")
+        key = key.lower()
+        if not sep or key not in FRONT_KEYS:
+            continue
+        value = value.strip()
+        # tags 仅接受 [a, b] 形式的内联数组
+        if key == "tags" and not (value.startswith("[") and value.endswith("]")):
+            continue
+        front[key] = value
     return front
 
 
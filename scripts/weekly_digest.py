@@ -1,5 +1,4 @@
 import datetime as dt
-import re
 import sys
 from pathlib import Path
 
@@ -8,11 +7,6 @@ PLAYBOOKS = ROOT / "docs" / "PLAYBOOKS"
 DIGEST_DIR = PLAYBOOKS / "DIGEST"
 DIGEST_DIR.mkdir(parents=True, exist_ok=True)
 
-FRONT_RE = re.compile(
-    r"^---\s*$|^id:\s*(.*)$|^date:\s*(.*)$|^module:\s*(.*)$|^severity:\s*(.*)$|^impact:\s*(.*)$|^tags:\s*\[(.*)\]\s*$",
-    re.IGNORECASE,
-)
-
 
 def parse_entries(md_path: Path):
     text = md_path.read_text(encoding="utf-8", errors="ignore").splitlines()
@@ -0,0 +1,44 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+GATE = ROOT / "scripts" / "quality_gate.py"
+
+
+def load_gate():
+    spec = importlib.util.spec_from_file_location("quality_gate", GATE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    "rules, warned",
+    [
+        ('units:\n  pressure: "kPa"\n', False),
+        ("units:\n  pressure: 'kPa'\n", False),
+        ('units:\n  pressure: "MPa"\n', True),
+        ('units:\n  pressure:\n  "kPa"\n', True),
+    ],
+)
+def test_pressure_unit_warning(tmp_path, monkeypatch, capsys, rules, warned):
+    gate = load_gate()
+    rules_cfg = tmp_path / "rules.yml"
+    rules_cfg.write_text(rules, encoding="utf-8")
+    monkeypatch.setattr(gate, "RULES_CFG", rules_cfg)
+    assert gate.main() == gate.OK
+    out = capsys.readouterr().out
+    assert ("[QUALITY_GATE][WARN]" in out) is warned
+
+
+def test_mapping_reports_first_violation_in_walk_order(tmp_path, monkeypatch, capsys):
+    gate = load_gate()
+    mapping = tmp_path / "data_mapping.json"
+    mapping.write_text('{"A": {"d": {"m": ["x/bad.csv"]}}, "B": [1]}', encoding="utf-8")
+    monkeypatch.setattr(gate, "MAPPING", mapping)
+    assert gate.main() == gate.FAIL
+    out = capsys.readouterr().out
+    assert "文件路径需以 'data/' 开头：x/bad.csv" in out
+    assert "站点 'B'" not in out